@@ -5,11 +5,33 @@ This module implements the 4-step calculation process from scene illumination
 to electron count in camera sensor pixels.
 """
 
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional - without it the compiled helpers run as plain Python
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
 # Physical constants
 PLANCK_CONSTANT = 6.62607015e-34  # J⋅Hz⁻¹
 SPEED_OF_LIGHT = 299792458  # m/s
 LUX_CONVERSION_FACTOR = 683  # lm/W at 555nm
 
+# Derived constants, folded once at import time
+_HC = PLANCK_CONSTANT * SPEED_OF_LIGHT  # J⋅m
+_HC_LUX = _HC * LUX_CONVERSION_FACTOR  # photons = lux × m² × s × λ(m) / _HC_LUX
+_PX_SCALE = 1e-12  # μm² → m²
+_K_ELECTRONS = _PX_SCALE * 1e-3 * 1e-9 / _HC_LUX  # μm², ms and nm scaling of the fused chain
+
+# Noise regime labels, indexed by the integer regime codes
+_REGIMES = ('shot_limited', 'dark_limited', 'read_limited', 'shot_dark_limited')
+
 
 def calculate_scene_luminance(scene_illuminance, scene_reflectance):
     """
@@ -22,7 +44,6 @@ def calculate_scene_luminance(scene_illuminance, scene_reflectance):
     Returns:
         float: Scene luminance (nits/cd⋅m⁻²)
     """
-    import math
     return (scene_illuminance * scene_reflectance) / math.pi
 
 
@@ -38,7 +59,6 @@ def calculate_sensor_illuminance(scene_luminance, lens_transmittance, f_number):
     Returns:
         float: Sensor illuminance (lux)
     """
-    import math
     return (scene_luminance * lens_transmittance * math.pi) / (4 * f_number**2)
 
 
@@ -58,13 +78,11 @@ def calculate_photon_count(sensor_illuminance, pixel_size_um, exposure_time_ms,
     # Convert sensor illuminance to irradiance
     sensor_irradiance = sensor_illuminance / LUX_CONVERSION_FACTOR  # W/m²
     
-    # Calculate pixel area (convert μm to m)
-    pixel_size_m = pixel_size_um * 1e-6
-    pixel_area = pixel_size_m**2  # m²
+    # Calculate pixel area (convert μm² to m²)
+    pixel_area = pixel_size_um * pixel_size_um * _PX_SCALE  # m²
     
     # Calculate energy of single photon (convert nm to m)
-    wavelength_m = wavelength_nm * 1e-9
-    photon_energy = (PLANCK_CONSTANT * SPEED_OF_LIGHT) / wavelength_m  # J
+    photon_energy = _HC / (wavelength_nm * 1e-9)  # J
     
     # Convert exposure time to seconds
     exposure_time_s = exposure_time_ms / 1000
@@ -99,97 +117,206 @@ def calculate_electrons(photon_count, quantum_efficiency):
     return photon_count * quantum_efficiency
 
 
-def calculate_noise_analysis(signal_electrons, exposure_time_ms, read_noise_electrons, dark_current_e_per_s):
+# fastmath without 'nnan'/'ninf': snr_db uses -inf as the zero-signal sentinel
+_FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def _noise_regime_code(shot_noise, dark_noise, read_noise, signal_electrons, dark_electrons):
     """
-    Calculate comprehensive noise analysis for camera sensor
+    Integer-coded noise regime, see determine_noise_regime() and _REGIMES
+    """
+    # Combined shot and dark noise above twice the read noise, compared squared
+    total_shot_dark_sq = signal_electrons + dark_electrons
+    if total_shot_dark_sq > 4 * read_noise * read_noise:
+        if signal_electrons > dark_electrons * 2:
+            return 0
+        elif dark_electrons > signal_electrons * 2:
+            return 1
+        else:
+            return 3
+    else:
+        return 2
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def _noise_core(signal_electrons, exposure_time_ms, read_noise_electrons, dark_current_e_per_s):
+    """
+    Pure arithmetic of calculate_noise_analysis()
     
-    Args:
-        signal_electrons (float): Signal electrons from light
-        exposure_time_ms (float): Exposure time in milliseconds
-        read_noise_electrons (float): Read noise in electrons RMS
-        dark_current_e_per_s (float): Dark current in electrons/pixel/second
+    Returns:
+        tuple: (dark_electrons, shot_noise, dark_noise, total_noise,
+                snr, snr_db, regime_code)
+    """
+    dark_electrons = dark_current_e_per_s * (exposure_time_ms / 1000.0)
+    
+    shot_noise = math.sqrt(max(signal_electrons, 0.0))
+    dark_noise = math.sqrt(max(dark_electrons, 0.0))
+    total_noise = math.sqrt(signal_electrons + dark_electrons + read_noise_electrons**2)
+    
+    snr = signal_electrons / total_noise if total_noise > 0 else 0.0
+    snr_db = 20 * math.log10(snr) if snr > 0 else -math.inf
+    
+    regime_code = _noise_regime_code(
+        shot_noise, dark_noise, read_noise_electrons, signal_electrons, dark_electrons
+    )
+    
+    return dark_electrons, shot_noise, dark_noise, total_noise, snr, snr_db, regime_code
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def _core(scene_illuminance, scene_reflectance, lens_transmittance, f_number,
+          pixel_size_um, exposure_time_ms, wavelength_nm, quantum_efficiency,
+          read_noise_electrons, dark_current_e_per_s):
+    """
+    Pure arithmetic of calculate_full_chain(), compiled when numba is available
     
     Returns:
-        dict: Complete noise analysis
+        tuple: (scene_luminance, sensor_illuminance, photon_count, electron_count,
+                sensor_irradiance, pixel_area, photon_energy, total_energy_per_pixel,
+                dark_electrons, shot_noise, dark_noise, total_noise,
+                snr, snr_db, regime_code)
     """
-    import math
+    scene_luminance = (scene_illuminance * scene_reflectance) / math.pi
+    sensor_illuminance = (scene_luminance * lens_transmittance * math.pi) / (4 * f_number**2)
+    
+    # Photon intermediates are returned as well, see calculate_photon_count()
+    sensor_irradiance = sensor_illuminance / LUX_CONVERSION_FACTOR
+    pixel_area = pixel_size_um * pixel_size_um * _PX_SCALE
+    photon_energy = _HC / (wavelength_nm * 1e-9)
+    total_energy_per_pixel = sensor_irradiance * pixel_area * (exposure_time_ms / 1000)
+    photon_count = total_energy_per_pixel / photon_energy
     
-    # Convert exposure time to seconds
-    exposure_time_s = exposure_time_ms / 1000.0
+    electron_count = photon_count * quantum_efficiency
     
-    # Calculate dark current electrons
-    dark_electrons = dark_current_e_per_s * exposure_time_s
+    (dark_electrons, shot_noise, dark_noise, total_noise,
+     snr, snr_db, regime_code) = _noise_core(
+        electron_count, exposure_time_ms, read_noise_electrons, dark_current_e_per_s
+    )
     
-    # Calculate individual noise components
-    shot_noise = math.sqrt(max(signal_electrons, 0))  # Shot noise from signal
-    dark_noise = math.sqrt(max(dark_electrons, 0))    # Shot noise from dark current
-    read_noise = read_noise_electrons                  # Read noise (constant)
+    return (scene_luminance, sensor_illuminance, photon_count, electron_count,
+            sensor_irradiance, pixel_area, photon_energy, total_energy_per_pixel,
+            dark_electrons, shot_noise, dark_noise, total_noise,
+            snr, snr_db, regime_code)
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def calculate_electrons_fast(scene_illuminance, scene_reflectance, lens_transmittance, f_number,
+                             pixel_size_um, exposure_time_ms, wavelength_nm, quantum_efficiency):
+    """
+    Steps 1-4 fused into a single closed-form expression
     
-    # Total noise (RSS - Root Sum of Squares)
-    total_noise = math.sqrt(signal_electrons + dark_electrons + read_noise**2)
+    Skips all intermediate values; the π of steps 1 and 2 cancels out.
     
-    # Signal-to-Noise Ratio
-    snr = signal_electrons / total_noise if total_noise > 0 else 0
-    snr_db = 20 * math.log10(snr) if snr > 0 else float('-inf')
+    Args:
+        Same as the first eight arguments of calculate_full_chain()
     
-    # Determine noise regime
-    noise_regime = determine_noise_regime(signal_electrons, dark_electrons, read_noise)
+    Returns:
+        float: Number of electrons generated per pixel
+    """
+    return (scene_illuminance * scene_reflectance * lens_transmittance * quantum_efficiency
+            * pixel_size_um * pixel_size_um * exposure_time_ms * wavelength_nm * _K_ELECTRONS
+            / (4.0 * f_number * f_number))
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def _fast_core(scene_illuminance, scene_reflectance, lens_transmittance, f_number,
+               pixel_size_um, exposure_time_ms, wavelength_nm, quantum_efficiency,
+               read_noise_electrons, dark_current_e_per_s):
+    """
+    Compiled body of calculate_full_chain_fast()
+    """
+    electron_count = calculate_electrons_fast(
+        scene_illuminance, scene_reflectance, lens_transmittance, f_number,
+        pixel_size_um, exposure_time_ms, wavelength_nm, quantum_efficiency
+    )
+    return electron_count, _noise_core(
+        electron_count, exposure_time_ms, read_noise_electrons, dark_current_e_per_s
+    )
+
+
+def calculate_full_chain_fast(scene_illuminance, scene_reflectance, lens_transmittance,
+                              f_number, pixel_size_um, exposure_time_ms,
+                              wavelength_nm, quantum_efficiency, read_noise_electrons=3.0,
+                              dark_current_e_per_s=0.1):
+    """
+    calculate_full_chain() without intermediate values or result dicts
     
+    Meant for live updates that only need the signal and noise figures; use
+    calculate_full_chain() for format_results_for_notebook() and plotting.
+    
+    Args:
+        Same as calculate_full_chain()
+    
+    Returns:
+        tuple: (electron_count, (dark_electrons, shot_noise, dark_noise,
+                total_noise, snr, snr_db, regime_code)), where regime_code
+                indexes _REGIMES
+    """
+    return _fast_core(
+        float(scene_illuminance), float(scene_reflectance), float(lens_transmittance),
+        float(f_number), float(pixel_size_um), float(exposure_time_ms),
+        float(wavelength_nm), float(quantum_efficiency),
+        float(read_noise_electrons), float(dark_current_e_per_s)
+    )
+
+
+def _noise_analysis_dict(signal_electrons, exposure_time_ms, read_noise_electrons,
+                         dark_electrons, shot_noise, dark_noise, total_noise,
+                         snr, snr_db, regime_code):
+    """Build the calculate_noise_analysis() result dict from _noise_core() output"""
     return {
         'signal_electrons': signal_electrons,
         'dark_electrons': dark_electrons,
         'noise_components': {
             'shot_noise': shot_noise,
             'dark_noise': dark_noise,
-            'read_noise': read_noise,
+            'read_noise': read_noise_electrons,
             'total_noise': total_noise
         },
         'snr': {
             'linear': snr,
             'db': snr_db
         },
-        'noise_regime': noise_regime,
-        'exposure_time_s': exposure_time_s
+        'noise_regime': _REGIMES[regime_code],
+        'exposure_time_s': exposure_time_ms / 1000.0
     }
 
 
-def determine_noise_regime(signal_electrons, dark_electrons, read_noise):
+def calculate_noise_analysis(signal_electrons, exposure_time_ms, read_noise_electrons, dark_current_e_per_s):
+    """
+    Calculate comprehensive noise analysis for camera sensor
+    
+    Args:
+        signal_electrons (float): Signal electrons from light
+        exposure_time_ms (float): Exposure time in milliseconds
+        read_noise_electrons (float): Read noise in electrons RMS
+        dark_current_e_per_s (float): Dark current in electrons/pixel/second
+    
+    Returns:
+        dict: Complete noise analysis
+    """
+    return _noise_analysis_dict(
+        signal_electrons, exposure_time_ms, read_noise_electrons,
+        *_noise_core(signal_electrons, exposure_time_ms, read_noise_electrons, dark_current_e_per_s)
+    )
+
+
+def determine_noise_regime(shot_noise, dark_noise, read_noise, signal_electrons, dark_electrons):
     """
     Determine which noise source dominates
     
     Args:
+        shot_noise (float): Shot noise from signal (electrons RMS)
+        dark_noise (float): Shot noise from dark current (electrons RMS)
+        read_noise (float): Read noise electrons
         signal_electrons (float): Signal electrons
         dark_electrons (float): Dark current electrons
-        read_noise (float): Read noise electrons
     
     Returns:
         str: Dominant noise regime
     """
-
-    import math
-    shot_noise = math.sqrt(max(signal_electrons, 0))
-    dark_noise = math.sqrt(max(dark_electrons, 0))
-    
-    # Find the largest noise component
-    noise_sources = {
-        'shot_limited': shot_noise,
-        'dark_limited': dark_noise,
-        'read_limited': read_noise
-    }
-    
-    dominant_regime = max(noise_sources, key=noise_sources.get)
-    
-    # Additional logic for combined regimes
-    total_shot_dark = math.sqrt(signal_electrons + dark_electrons)
-    if total_shot_dark > read_noise * 2:
-        if signal_electrons > dark_electrons * 2:
-            return 'shot_limited'
-        elif dark_electrons > signal_electrons * 2:
-            return 'dark_limited'
-        else:
-            return 'shot_dark_limited'
-    else:
-        return 'read_limited'
+    return _REGIMES[_noise_regime_code(shot_noise, dark_noise, read_noise, signal_electrons, dark_electrons)]
 
 
 def calculate_full_chain(scene_illuminance, scene_reflectance, lens_transmittance, 
@@ -214,38 +341,183 @@ def calculate_full_chain(scene_illuminance, scene_reflectance, lens_transmittanc
     Returns:
         dict: Complete results with intermediate values and noise analysis
     """
-    # Step 1: Scene luminance
-    scene_luminance = calculate_scene_luminance(scene_illuminance, scene_reflectance)
+    inputs = {
+        'scene_illuminance_lux': scene_illuminance,
+        'scene_reflectance': scene_reflectance,
+        'lens_transmittance': lens_transmittance,
+        'f_number': f_number,
+        'pixel_size_um': pixel_size_um,
+        'exposure_time_ms': exposure_time_ms,
+        'wavelength_nm': wavelength_nm,
+        'quantum_efficiency': quantum_efficiency,
+        'read_noise_electrons': read_noise_electrons,
+        'dark_current_e_per_s': dark_current_e_per_s
+    }
     
-    # Step 2: Sensor illuminance
-    sensor_illuminance = calculate_sensor_illuminance(scene_luminance, lens_transmittance, f_number)
+    (scene_luminance, sensor_illuminance, photon_count, electron_count,
+     sensor_irradiance, pixel_area, photon_energy, total_energy_per_pixel,
+     *noise_values) = _core(
+        float(scene_illuminance), float(scene_reflectance), float(lens_transmittance),
+        float(f_number), float(pixel_size_um), float(exposure_time_ms),
+        float(wavelength_nm), float(quantum_efficiency),
+        float(read_noise_electrons), float(dark_current_e_per_s)
+    )
     
-    # Step 3: Photon count
-    photon_count, photon_intermediates = calculate_photon_count(
-        sensor_illuminance, pixel_size_um, exposure_time_ms, wavelength_nm
+    return {
+        'inputs': inputs,
+        'results': {
+            'scene_luminance_nits': scene_luminance,
+            'sensor_illuminance_lux': sensor_illuminance,
+            'photon_count': photon_count,
+            'electron_count': electron_count
+        },
+        'noise_analysis': _noise_analysis_dict(
+            electron_count, exposure_time_ms, read_noise_electrons, *noise_values
+        ),
+        'intermediates': {
+            'sensor_irradiance_w_per_m2': sensor_irradiance,
+            'pixel_area_m2': pixel_area,
+            'photon_energy_j': photon_energy,
+            'exposure_time_s': exposure_time_ms / 1000,
+            'total_energy_per_pixel_j': total_energy_per_pixel
+        }
+    }
+
+
+def calculate_noise_analysis_vec(signal_electrons, exposure_time_ms, read_noise_electrons, dark_current_e_per_s):
+    """
+    Vectorized noise analysis for parameter sweeps
+    
+    Same model as calculate_noise_analysis(), but all arguments may be NumPy
+    arrays (or scalars) which are broadcast against each other.
+    
+    Args:
+        signal_electrons (array_like): Signal electrons from light
+        exposure_time_ms (array_like): Exposure time in milliseconds
+        read_noise_electrons (array_like): Read noise in electrons RMS
+        dark_current_e_per_s (array_like): Dark current in electrons/pixel/second
+    
+    Returns:
+        dict: Noise analysis with ndarray values; 'noise_regime' holds the
+        regime names and 'noise_regime_code' the indices into _REGIMES
+    """
+    signal_electrons = np.asarray(signal_electrons, dtype=float)
+    read_noise = np.asarray(read_noise_electrons, dtype=float)
+    
+    exposure_time_s = np.asarray(exposure_time_ms, dtype=float) / 1000.0
+    dark_electrons = np.asarray(dark_current_e_per_s, dtype=float) * exposure_time_s
+    
+    shot_noise = np.sqrt(np.maximum(signal_electrons, 0.0))
+    dark_noise = np.sqrt(np.maximum(dark_electrons, 0.0))
+    total_noise = np.sqrt(signal_electrons + dark_electrons + read_noise**2)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        snr = np.where(total_noise > 0, signal_electrons / total_noise, 0.0)
+        snr_db = np.where(snr > 0, 20 * np.log10(snr), -np.inf)
+    
+    regime_code = determine_noise_regime_vec(
+        shot_noise, dark_noise, read_noise, signal_electrons, dark_electrons
     )
     
-    # Step 4: Electron count
-    electron_count = calculate_electrons(photon_count, quantum_efficiency)
+    return {
+        'signal_electrons': signal_electrons,
+        'dark_electrons': dark_electrons,
+        'noise_components': {
+            'shot_noise': shot_noise,
+            'dark_noise': dark_noise,
+            'read_noise': np.broadcast_to(read_noise, total_noise.shape),
+            'total_noise': total_noise
+        },
+        'snr': {
+            'linear': snr,
+            'db': snr_db
+        },
+        'noise_regime': np.asarray(_REGIMES)[regime_code],
+        'noise_regime_code': regime_code,
+        'exposure_time_s': exposure_time_s
+    }
+
+
+def determine_noise_regime_vec(shot_noise, dark_noise, read_noise, signal_electrons, dark_electrons):
+    """
+    Vectorized version of determine_noise_regime()
+    
+    Args:
+        shot_noise (array_like): Shot noise from signal (electrons RMS)
+        dark_noise (array_like): Shot noise from dark current (electrons RMS)
+        read_noise (array_like): Read noise electrons
+        signal_electrons (array_like): Signal electrons
+        dark_electrons (array_like): Dark current electrons
+    
+    Returns:
+        ndarray: Integer regime codes, indices into _REGIMES
+    """
+    read_noise = np.asarray(read_noise, dtype=float)
+    signal_electrons = np.asarray(signal_electrons, dtype=float)
+    dark_electrons = np.asarray(dark_electrons, dtype=float)
+    
+    total_shot_dark_sq = signal_electrons + dark_electrons
+    return np.select(
+        [
+            total_shot_dark_sq <= 4 * read_noise * read_noise,
+            signal_electrons > dark_electrons * 2,
+            dark_electrons > signal_electrons * 2
+        ],
+        [2, 0, 1],
+        default=3
+    )
+
+
+def calculate_full_chain_vec(scene_illuminance, scene_reflectance, lens_transmittance, 
+                            f_number, pixel_size_um, exposure_time_ms, 
+                            wavelength_nm, quantum_efficiency, read_noise_electrons=3.0, 
+                            dark_current_e_per_s=0.1):
+    """
+    Vectorized calculate_full_chain() for parameter sweeps
+    
+    Every parameter may be a scalar or a NumPy array; arrays are broadcast
+    against each other so a whole sweep is evaluated in a few ufunc calls
+    instead of a Python loop.
+    
+    Args:
+        Same as calculate_full_chain(), each as array_like
+    
+    Returns:
+        dict: Same layout as calculate_full_chain() with ndarray values
+    """
+    inputs = {
+        'scene_illuminance_lux': np.asarray(scene_illuminance, dtype=float),
+        'scene_reflectance': np.asarray(scene_reflectance, dtype=float),
+        'lens_transmittance': np.asarray(lens_transmittance, dtype=float),
+        'f_number': np.asarray(f_number, dtype=float),
+        'pixel_size_um': np.asarray(pixel_size_um, dtype=float),
+        'exposure_time_ms': np.asarray(exposure_time_ms, dtype=float),
+        'wavelength_nm': np.asarray(wavelength_nm, dtype=float),
+        'quantum_efficiency': np.asarray(quantum_efficiency, dtype=float),
+        'read_noise_electrons': np.asarray(read_noise_electrons, dtype=float),
+        'dark_current_e_per_s': np.asarray(dark_current_e_per_s, dtype=float)
+    }
+    
+    # Steps 1-4 are pure elementwise arithmetic and broadcast as-is
+    scene_luminance = calculate_scene_luminance(
+        inputs['scene_illuminance_lux'], inputs['scene_reflectance']
+    )
+    sensor_illuminance = calculate_sensor_illuminance(
+        scene_luminance, inputs['lens_transmittance'], inputs['f_number']
+    )
+    photon_count, photon_intermediates = calculate_photon_count(
+        sensor_illuminance, inputs['pixel_size_um'], inputs['exposure_time_ms'], inputs['wavelength_nm']
+    )
+    electron_count = calculate_electrons(photon_count, inputs['quantum_efficiency'])
     
     # Step 5: Noise analysis
-    noise_analysis = calculate_noise_analysis(
-        electron_count, exposure_time_ms, read_noise_electrons, dark_current_e_per_s
+    noise_analysis = calculate_noise_analysis_vec(
+        electron_count, inputs['exposure_time_ms'],
+        inputs['read_noise_electrons'], inputs['dark_current_e_per_s']
     )
     
     return {
-        'inputs': {
-            'scene_illuminance_lux': scene_illuminance,
-            'scene_reflectance': scene_reflectance,
-            'lens_transmittance': lens_transmittance,
-            'f_number': f_number,
-            'pixel_size_um': pixel_size_um,
-            'exposure_time_ms': exposure_time_ms,
-            'wavelength_nm': wavelength_nm,
-            'quantum_efficiency': quantum_efficiency,
-            'read_noise_electrons': read_noise_electrons,
-            'dark_current_e_per_s': dark_current_e_per_s
-        },
+        'inputs': inputs,
         'results': {
             'scene_luminance_nits': scene_luminance,
             'sensor_illuminance_lux': sensor_illuminance,
@@ -257,6 +529,27 @@ def calculate_full_chain(scene_illuminance, scene_reflectance, lens_transmittanc
     }
 
 
+def _check_full_results(results, caller):
+    """Raise a clear error if results is not a full calculate_full_chain() result"""
+    if not isinstance(results, dict) or 'intermediates' not in results:
+        raise ValueError(
+            f"{caller}() needs the full result dict of calculate_full_chain(), "
+            f"not the reduced output of calculate_full_chain_fast()"
+        )
+
+
+# Regime color coding for format_results_for_notebook()
+_REGIME_COLORS = {
+    'shot_limited': '#28a745',
+    'dark_limited': '#dc3545',
+    'read_limited': '#ffc107',
+    'shot_dark_limited': '#17a2b8'
+}
+
+# Display names of the noise regimes, e.g. 'shot_dark_limited' -> 'Shot Dark Limited'
+_REGIME_LABELS = {regime: regime.replace('_', ' ').title() for regime in _REGIMES}
+
+
 def format_results_for_notebook(results):
     """
     Format calculation results for nice display in Jupyter notebook
@@ -269,19 +562,15 @@ def format_results_for_notebook(results):
     """
     from IPython.display import HTML
     
+    _check_full_results(results, 'format_results_for_notebook')
+    
     inputs = results['inputs']
     res = results['results']
     noise = results['noise_analysis']
     inter = results['intermediates']
     
     # Determine regime color coding
-    regime_colors = {
-        'shot_limited': '#28a745',
-        'dark_limited': '#dc3545', 
-        'read_limited': '#ffc107',
-        'shot_dark_limited': '#17a2b8'
-    }
-    regime_color = regime_colors.get(noise['noise_regime'], '#6c757d')
+    regime_color = _REGIME_COLORS.get(noise['noise_regime'], '#6c757d')
     
     html = f"""
     <div style="font-family: 'Courier New', monospace; background-color: #f8f9fa; padding: 15px; border-radius: 8px; border: 1px solid #dee2e6;">
@@ -323,7 +612,7 @@ def format_results_for_notebook(results):
                 </div>
             </div>
             <div style="margin-top: 10px; text-align: center;">
-                <strong style="color: {regime_color};">Noise Regime: {noise['noise_regime'].replace('_', ' ').title()}</strong>
+                <strong style="color: {regime_color};">Noise Regime: {_REGIME_LABELS[noise['noise_regime']]}</strong>
             </div>
         </div>
         
@@ -352,6 +641,16 @@ def format_results_for_notebook(results):
     return HTML(html)
 
 
+# Labels for get_calculation_data_for_plotting()
+_STEP_NAMES = (
+    'Scene\nLuminance',
+    'Sensor\nIlluminance',
+    'Photon\nCount',
+    'Electron\nCount'
+)
+_STEP_UNITS = ('nits', 'lux', 'photons', 'electrons')
+
+
 def get_calculation_data_for_plotting(results):
     """
     Extract data from results for visualization
@@ -360,26 +659,18 @@ def get_calculation_data_for_plotting(results):
         results (dict): Results from calculate_full_chain()
     
     Returns:
-        tuple: (step_names, step_values, units)
+        tuple: (step_names, step_values, units), step_values as ndarray
     """
-    res = results['results']
+    _check_full_results(results, 'get_calculation_data_for_plotting')
     
-    step_names = [
-        'Scene\nLuminance',
-        'Sensor\nIlluminance', 
-        'Photon\nCount',
-        'Electron\nCount'
-    ]
+    res = results['results']
     
     # Normalize values for plotting (log scale)
-    import math
-    step_values = [
-        math.log10(max(res['scene_luminance_nits'], 1e-10)),
-        math.log10(max(res['sensor_illuminance_lux'], 1e-10)),
-        math.log10(max(res['photon_count'], 1e-10)),
-        math.log10(max(res['electron_count'], 1e-10))
-    ]
-    
-    units = ['nits', 'lux', 'photons', 'electrons']
-    
-    return step_names, step_values, units
\ No newline at end of file
+    step_values = np.log10(np.maximum(np.array([
+        res['scene_luminance_nits'],
+        res['sensor_illuminance_lux'],
+        res['photon_count'],
+        res['electron_count']
+    ]), 1e-10))
+    
+    return _STEP_NAMES, step_values, _STEP_UNITS